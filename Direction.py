@@ -1,47 +1,55 @@
-from enum import Enum
+from enum import IntEnum
 from typing import Tuple, Optional
 
-class Direction(Enum):
+# Per-direction tables, indexed by Direction (numbered clockwise from north)
+ANGLES = (0, 90, 180, 270)
+MOVE_VECS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+DELTA_KEYS = ('delta_u', 'delta_r', 'delta_d', 'delta_l')
+LEFT_OF = (3, 0, 1, 2)
+RIGHT_OF = (1, 2, 3, 0)
+
+# Number of 90-degree turns on the shortest rotation between two directions,
+# indexed by [from_direction][to_direction]
+ROT_COUNT = (
+    (0, 1, 2, 1),
+    (1, 0, 1, 2),
+    (2, 1, 0, 1),
+    (1, 2, 1, 0)
+)
+
+class Direction(IntEnum):
     """Cardinal directions with movement vectors and angle information."""
-    NORTH = (0, (0, 1), 'delta_u')
-    EAST = (90, (1, 0), 'delta_r')
-    SOUTH = (180, (0, -1), 'delta_d')
-    WEST = (270, (-1, 0), 'delta_l')
-
-    def __init__(self, angle: int, movement_vector: Tuple[int, int], delta_key: str):
-        """Initialize direction with angle, movement vector, and delta key."""
-        self.angle = angle
-        self.movement_vector = movement_vector
-        self.delta_key = delta_key
-    
-    @property
-    def left(self) -> 'Direction':
-        """Return the direction 90 degrees to the left."""
-        return Direction.from_angle(self.angle - 90)
-    
-    @property
-    def right(self) -> 'Direction':
-        """Return the direction 90 degrees to the right."""
-        return Direction.from_angle(self.angle + 90)
-    
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
     @classmethod
     def from_angle(cls, angle: int) -> 'Direction':
-        """Get a direction from an angle in degrees."""
-        normalized_angle = angle % 360
-        direction_map = {
-            0: cls.NORTH,
-            90: cls.EAST,
-            180: cls.SOUTH,
-            270: cls.WEST
-        }
-        return direction_map[normalized_angle]
-    
+        """Get a direction from an angle in degrees (a multiple of 90)."""
+        return _DIRECTIONS[(angle // 90) & 3]
+
     def get_relative_position(self, position: str) -> Optional[Tuple[int, int]]:
         """Get movement vector for a relative position (forward, left, right)."""
-        if position == 'forward':
-            return self.movement_vector
-        elif position == 'left':
-            return self.left.movement_vector
-        elif position == 'right':
-            return self.right.movement_vector
-        return None
+        return self.relative_vectors.get(position)
+
+
+# Directions in value order, so a table index maps back to its direction
+_DIRECTIONS = tuple(Direction)
+
+# Mirror the tables as attributes and resolve neighbouring directions, relative
+# movement vectors and the directions covered by the forward/left/right sensors
+# once here rather than on every sensor read
+for _direction in Direction:
+    _direction.angle = ANGLES[_direction]
+    _direction.movement_vector = MOVE_VECS[_direction]
+    _direction.delta_key = DELTA_KEYS[_direction]
+    _direction.left = _DIRECTIONS[LEFT_OF[_direction]]
+    _direction.right = _DIRECTIONS[RIGHT_OF[_direction]]
+    _direction.relative_vectors = {
+        'forward': MOVE_VECS[_direction],
+        'left': MOVE_VECS[LEFT_OF[_direction]],
+        'right': MOVE_VECS[RIGHT_OF[_direction]]
+    }
+    _direction.sensor_directions = (_direction, _direction.left, _direction.right)
+del _direction
@@ -1,75 +1,168 @@
 import csv
-from typing import Dict, Tuple, Optional
+import sys
+from typing import NamedTuple, Tuple, Optional
+from Direction import Direction
+
+class CellData(NamedTuple):
+    """Snapshot of the data stored for one cell."""
+    delta_l: int
+    delta_r: int
+    delta_u: int
+    delta_d: int
+    texture: str
+    dust_weight: float
+    cleaned: bool
 
 class Environment:
     """Grid-based environment with dust, texture, and height deltas."""
-    
+
     def __init__(self, area_file: str):
         """Initialize environment from CSV file."""
-        self.grid = {}
+        # Cell data is stored as parallel column-major arrays indexed
+        # [x - min_x][y - min_y]; use index() to translate coordinates
+        self.width = 0
+        self.height = 0
+        self._min_x = 0
+        self._min_y = 0
+        self._max_x = 0
+        self._max_y = 0
+        self.valid = []
+        self.dust = []
+        self.cleaned = []
+        self.texture = []
+        self.deltas = ()  # Height delta arrays indexed by Direction
+        self._dirty_count = 0
+        self._total_cells = 0
         self.load_area(area_file)
-        
+
     def load_area(self, area_file: str):
-        """Load environment data from CSV file."""
-        with open(area_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                x = int(row['XCoordination'])
-                y = int(row['YCoordination'])
-                self.grid[(x, y)] = {
-                    'delta_l': int(row['DeltaL']),
-                    'delta_r': int(row['DeltaR']),
-                    'delta_u': int(row['DeltaU']),
-                    'delta_d': int(row['DeltaD']),
-                    'texture': row['Texture'],
-                    'dust_weight': float(row['DustWeight']),
-                    'cleaned': False
-                }
-    
-    def get_cell(self, x: int, y: int) -> Optional[Dict]:
+        """
+        Load environment data from CSV file.
+        The arrays cover every position between the smallest and largest
+        coordinates, so very sparse areas cost memory.
+        """
+        with open(area_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            columns = list(zip(*(row for row in reader if row)))
+
+        # Convert each column in one pass instead of field by field per row
+        def parse(name, kind):
+            return list(map(kind, columns[header.index(name)])) if columns else []
+
+        xs = parse('XCoordination', int)
+        ys = parse('YCoordination', int)
+
+        # Record the bounds once and size the arrays from them
+        self._min_x = min(xs, default=0)
+        self._min_y = min(ys, default=0)
+        self._max_x = max(xs, default=0)
+        self._max_y = max(ys, default=0)
+        self.width = self._max_x - self._min_x + 1 if xs else 0
+        self.height = self._max_y - self._min_y + 1 if ys else 0
+
+        def column(value):
+            return [[value] * self.height for _ in range(self.width)]
+
+        self.valid = column(False)
+        self.dust = column(0.0)
+        self.cleaned = column(False)
+        self.texture = column(None)
+        self.deltas = tuple(column(0) for _ in Direction)
+
+        # Scatter each parsed column into its array
+        fields = (
+            (self.valid, [True] * len(xs)),
+            (self.deltas[Direction.WEST], parse('DeltaL', int)),
+            (self.deltas[Direction.EAST], parse('DeltaR', int)),
+            (self.deltas[Direction.NORTH], parse('DeltaU', int)),
+            (self.deltas[Direction.SOUTH], parse('DeltaD', int)),
+            (self.texture, parse('Texture', str)),
+            (self.dust, parse('DustWeight', float))
+        )
+        columns_x = [x - self._min_x for x in xs]
+        columns_y = [y - self._min_y for y in ys]
+        for array, values in fields:
+            for i, j, value in zip(columns_x, columns_y, values):
+                array[i][j] = value
+
+        # Track dirty cells incrementally so percent_dirty never rescans the grid
+        self._total_cells = sum(map(sum, self.valid))
+        self._dirty_count = sum(1 for dust_column in self.dust for dust_weight in dust_column if dust_weight > 0)
+
+    def index(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Get the array indices of the cell at specified coordinates, or None if there is no cell."""
+        i = x - self._min_x
+        j = y - self._min_y
+        if 0 <= i < self.width and 0 <= j < self.height and self.valid[i][j]:
+            return i, j
+        return None
+
+    def is_valid(self, x: int, y: int) -> bool:
+        """Check whether the coordinates refer to a cell in the area."""
+        return self.index(x, y) is not None
+
+    def get_cell(self, x: int, y: int) -> Optional[CellData]:
         """Get cell data at specified coordinates."""
-        return self.grid.get((x, y))
-    
-    def get_sucked(self, x: int, y: int, pressure: float):
-        """Remove dust from a cell based on suction pressure."""
-        cell = self.grid.get((x, y))
-        if not cell:
-            return
-            
-        dust_weight = cell['dust_weight']
+        cell = self.index(x, y)
+        if cell is None:
+            return None
+
+        i, j = cell
+        return CellData(
+            delta_l=self.deltas[Direction.WEST][i][j],
+            delta_r=self.deltas[Direction.EAST][i][j],
+            delta_u=self.deltas[Direction.NORTH][i][j],
+            delta_d=self.deltas[Direction.SOUTH][i][j],
+            texture=self.texture[i][j],
+            dust_weight=self.dust[i][j],
+            cleaned=self.cleaned[i][j]
+        )
+
+    def get_sucked(self, x: int, y: int, pressure: float) -> Optional[float]:
+        """Remove dust from a cell based on suction pressure and return the dust left."""
+        cell = self.index(x, y)
+        if cell is None:
+            return None
 
         # If pressure is enough to clean the cell
+        i, j = cell
+        dust_weight = self.dust[i][j]
         if 0 >= dust_weight - pressure:
-            self.grid[(x, y)]['dust_weight'] = 0
-            self.grid[(x, y)]['cleaned'] = True
+            if dust_weight > 0:
+                self._dirty_count -= 1
+            self.dust[i][j] = 0
+            self.cleaned[i][j] = True
+
+        return self.dust[i][j]
 
     def get_dimensions(self) -> Tuple[int, int]:
         """Get maximum x and y coordinates in the grid."""
-        if not self.grid:
-            return 0, 0
-            
-        x_coords, y_coords = zip(*self.grid.keys())
-        return max(x_coords), max(y_coords)
-    
+        return self._max_x, self._max_y
+
     def percent_dirty(self) -> float:
         """Calculate percentage of dirty cells (0-100)."""
-        if not self.grid:
+        if not self._total_cells:
             return 0.0
-            
-        total_cells = len(self.grid)
-        dirty_cells = sum(1 for cell in self.grid.values() if cell['dust_weight'] > 0)
-        
-        return (dirty_cells / total_cells) * 100
-    
+
+        return (self._dirty_count / self._total_cells) * 100
+
     def print_dust(self):
         """Print dust levels in a grid format."""
-        max_x, max_y = self.get_dimensions()
-        
-        for y in range(max_y + 1):
-            for x in range(max_x + 1):
-                cell = self.get_cell(x, y)
-                if cell:
-                    print(f"{cell['dust_weight']:.1f}", end="\t")
-                else:
-                    print("-", end="\t")
-            print()
+        # Transpose the column-major arrays into rows, then pad or trim each
+        # row to the 0..max_x range and write the grid at once
+        valid_rows = list(zip(*self.valid))
+        dust_rows = list(zip(*self.dust))
+        pad = ["-\t"] * max(self._min_x, 0)
+        skip = max(-self._min_x, 0)
+
+        lines = []
+        for y in range(self._max_y + 1):
+            j = y - self._min_y
+            if 0 <= j < self.height:
+                cells = [f"{dust_weight:.1f}\t" if valid else "-\t"
+                         for valid, dust_weight in zip(valid_rows[j], dust_rows[j])]
+                lines.append(''.join(pad + cells[skip:]) + '\n')
+            else:
+                lines.append("-\t" * (self._max_x + 1) + '\n')
+        sys.stdout.write(''.join(lines))
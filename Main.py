@@ -22,7 +22,7 @@ def run_simulation(settings_file: str, area_file: str, verbose: bool):
         verbose: Whether to print detailed output
     """
     # Initialize components
-    settings = VacuumSettings(settings_file, verbose=verbose)
+    settings = VacuumSettings.from_file(settings_file, verbose=verbose)
     environment = Environment(area_file)
     vacuum = VacuumAgent(settings)
 
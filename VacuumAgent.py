@@ -1,14 +1,33 @@
 import heapq
+import itertools
+from collections import deque
+from bisect import bisect_left, insort
 from typing import Tuple, Dict, List, Optional, Set
-from VacuumSettings import VacuumSettings
-from Direction import Direction
+from VacuumSettings import VacuumSettings, SuctionMode, MAX_SAFE_HEIGHT, MAX_SUCTION_WEIGHT
+from Direction import Direction, ROT_COUNT, MOVE_VECS, DELTA_KEYS
 from Environment import Environment
 
+# Offsets within Manhattan distance 2 and the nearby-dirt bonus a dirty cell
+# contributes at each of them
+DIRT_PROXIMITY_STENCIL = tuple(
+    (dx, dy, (3.0 - abs(dx) - abs(dy)) * 3.0)
+    for dx in range(-2, 3) for dy in range(-2, 3)
+    if abs(dx) + abs(dy) <= 2
+)
+
 class VacuumAgent:
     """
     Autonomous vacuum cleaner agent that navigates and cleans an environment.
     Uses sensors, memory, and decision-making algorithms to clean efficiently.
     """
+    __slots__ = (
+        'position', 'direction', 'settings', 'power_consumed',
+        'directions', '_neighbor_table', 'cleaned_cells', 'dirty_cells',
+        '_dirty_by_diagonal', '_dirt_proximity', 'map', 'visited_cells',
+        'last_visit_time', 'visit_count', 'time', 'current_path',
+        '_suck_power', '_suck_weight'
+    )
+
     def __init__(self, settings: VacuumSettings):
         """Initialize agent with operational settings."""
         # Position and orientation
@@ -18,13 +37,20 @@ class VacuumAgent:
         # Settings and resources
         self.settings = settings
         self.power_consumed = 0
+        self._suck_power = (settings.normal_vacuum_power, settings.heavy_vacuum_power)  # Indexed by SuctionMode
+        self._suck_weight = MAX_SUCTION_WEIGHT
         
         # Memory and navigation
         self.directions = [Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST]
+        self._neighbor_table = [    # (dx, dy, delta_key, direction) for neighbour expansion
+            (MOVE_VECS[d][0], MOVE_VECS[d][1], DELTA_KEYS[d], d) for d in self.directions
+        ]
         self.cleaned_cells = set()  
         self.dirty_cells = set()    
+        self._dirty_by_diagonal = []  # Dirty cells as sorted (x+y, x-y) pairs
+        self._dirt_proximity = {}     # Nearby-dirt bonus per position
         self.map = {}               # Known environment information
-        self.visited_cells = []     
+        self.visited_cells = set()  
         self.last_visit_time = {}   
         self.visit_count = {}       
         
@@ -35,16 +61,8 @@ class VacuumAgent:
     
     def rotate(self, target_direction: Direction):
         """Rotate to face target direction and update power consumption."""
-        current_angle = self.direction.angle
-        target_angle = target_direction.angle
-        
-        # Calculate shortest rotation path
-        diff = (target_angle - current_angle) % 360
-        if diff > 180:
-            diff -= 360
-            
         # Update power and direction
-        rotations = abs(diff) / 90
+        rotations = ROT_COUNT[self.direction][target_direction]
         self.power_consumed += rotations * self.settings.rotation_power
         self.direction = target_direction
 
@@ -53,13 +71,14 @@ class VacuumAgent:
         Move forward one cell in current direction.
         Returns True if successful, False otherwise.
         """
+        move_vector = MOVE_VECS[self.direction]
         new_pos = (
-            self.position[0] + self.direction.movement_vector[0],
-            self.position[1] + self.direction.movement_vector[1]
+            self.position[0] + move_vector[0],
+            self.position[1] + move_vector[1]
         )
     
         # Check if new position is valid
-        if env.get_cell(*new_pos):
+        if env.is_valid(*new_pos):
             self.position = new_pos
             self.power_consumed += self.settings.move_power
             return True
@@ -74,16 +93,17 @@ class VacuumAgent:
         """Sense height delta in a direction relative to the agent."""
         self.power_consumed += self.settings.sensor_power
         
-        current_cell = env.get_cell(*self.position)
-        if not current_cell:
+        cell = env.index(*self.position)
+        if cell is None:
             return None
             
+        i, j = cell
         if sensor_position == 'forward':
-            return current_cell[self.direction.delta_key]
+            return env.deltas[self.direction][i][j]
         elif sensor_position == 'left':
-            return current_cell[self.direction.left.delta_key]
+            return env.deltas[self.direction.left][i][j]
         elif sensor_position == 'right':
-            return current_cell[self.direction.right.delta_key]
+            return env.deltas[self.direction.right][i][j]
         
         return None
     
@@ -99,9 +119,11 @@ class VacuumAgent:
                 return (self.position, self.map[self.position]['dust_weight'])
             
             # Otherwise use sensor
-            cell = env.get_cell(*self.position)
             self.power_consumed += self.settings.sensor_power
-            return (self.position, cell['dust_weight']) if cell else None
+            cell = env.index(*self.position)
+            if cell is None:
+                return None
+            return (self.position, env.dust[cell[0]][cell[1]])
 
         # Check relative position
         move_vector = self.direction.get_relative_position(sensor_position)
@@ -118,20 +140,26 @@ class VacuumAgent:
         
         # Otherwise use sensor
         self.power_consumed += self.settings.sensor_power
-        cell = env.get_cell(target_x, target_y)        
-        return ((target_x, target_y), cell['dust_weight']) if cell else None
+        cell = env.index(target_x, target_y)
+        if cell is None:
+            return None
+        return (target_pos, env.dust[cell[0]][cell[1]])
 
     # ---- Cleaning Methods ----
     
-    def suck_dust(self, env: Environment, pressure: str):
-        """Clean current cell with specified pressure level (normal/heavy)."""
+    def suck_dust(self, env: Environment, pressure: SuctionMode) -> Optional[float]:
+        """
+        Clean current cell with specified pressure level (normal/heavy).
+        Returns the dust weight left in the cell, or None if no suction was applied.
+        """
         # Only consume power if not already cleaned
         if self.position not in self.cleaned_cells:
-            vacuum_power_attr = f"{pressure}_vacuum_power"
-            self.power_consumed += getattr(self.settings, vacuum_power_attr)
+            self.power_consumed += self._suck_power[pressure]
             
             # Apply suction to environment
-            env.get_sucked(*self.position, self.settings.MAX_SUCTION_WEIGHT[pressure])
+            return env.get_sucked(*self.position, self._suck_weight[pressure])
+        
+        return None
 
     # ---- Memory and Mapping ----
     
@@ -142,87 +170,110 @@ class VacuumAgent:
         self.last_visit_time[self.position] = self.time
         self.visit_count[self.position] = self.visit_count.get(self.position, 0) + 1
 
-        # Record visit if first time
-        if self.position not in self.visited_cells:
-            self.visited_cells.append(self.position)
-        
-        # Get current cell info
-        current_cell_info = self.sense_dust(env, 'current')
+        # Record visit
+        self.visited_cells.add(self.position)
+        
+        # Read everything the sensors need up front
+        known_map = self.map
+        sensor_power = self.settings.sensor_power
+        sensor_directions = self.direction.sensor_directions  # forward, left, right
+        x, y = self.position
+        cell = env.index(x, y)
+        
+        # Get current cell info, using cached data if available
+        current_info = known_map.get(self.position)
+        if current_info is not None and 'dust_weight' in current_info:
+            dust_weight = current_info['dust_weight']
+        else:
+            self.power_consumed += sensor_power
+            dust_weight = env.dust[cell[0]][cell[1]] if cell is not None else None
         
-        if current_cell_info:
-            position, dust_weight = current_cell_info
-            
+        if dust_weight is not None:
             # Initialize map entry if needed
-            if self.position not in self.map:
-                self.map[self.position] = {}
+            if current_info is None:
+                current_info = known_map[self.position] = {}
                 
             # Update dust and cleaning info
-            self.map[self.position]['dust_weight'] = dust_weight
-            self.map[self.position]['cleaned'] = dust_weight == 0
+            current_info['dust_weight'] = dust_weight
+            current_info['cleaned'] = dust_weight == 0
             
-            # Sense heights in all directions
-            for direction in ['forward', 'left', 'right']:
-                height = self.sense_height(env, direction)
-                if height is not None:
-                    if direction == 'forward':
-                        self.map[self.position][self.direction.delta_key] = height
-                    elif direction == 'left':
-                        self.map[self.position][self.direction.left.delta_key] = height
-                    elif direction == 'right':
-                        self.map[self.position][self.direction.right.delta_key] = height
+            # Sense heights forward, left and right
+            for direction in sensor_directions:
+                self.power_consumed += sensor_power
+                if cell is not None:
+                    current_info[DELTA_KEYS[direction]] = env.deltas[direction][cell[0]][cell[1]]
             
-            # Update dirty/clean cell sets
-            if dust_weight > 0:
-                self.dirty_cells.add(self.position)
-            elif self.position in self.dirty_cells and dust_weight == 0:
-                self.dirty_cells.remove(self.position)
-                self.cleaned_cells.add(self.position)
-        
-        # Sense adjacent cells
-        for sensor_position in ['forward', 'left', 'right']:
-            adjacent_info = self.sense_dust(env, sensor_position)
+            self._record_dust(self.position, dust_weight)
+        
+        # Sense adjacent cells forward, left and right
+        for direction in sensor_directions:
+            move_vector = MOVE_VECS[direction]
+            position = (x + move_vector[0], y + move_vector[1])
             
-            if adjacent_info:
-                position, dust_weight = adjacent_info
-                
-                move_vector = self.direction.get_relative_position(sensor_position)
-                if not move_vector:
+            # Use cached data if available, otherwise use sensor
+            adjacent_info = known_map.get(position)
+            if adjacent_info is not None and 'dust_weight' in adjacent_info:
+                dust_weight = adjacent_info['dust_weight']
+            else:
+                self.power_consumed += sensor_power
+                adjacent_cell = env.index(*position)
+                if adjacent_cell is None:
                     continue
-
-                # Update map for adjacent cell
-                if position not in self.map:
-                    self.map[position] = {}
-                
-                self.map[position]['dust_weight'] = dust_weight
-                self.map[position]['cleaned'] = dust_weight == 0
+                dust_weight = env.dust[adjacent_cell[0]][adjacent_cell[1]]
                 
-                # Update dirty/clean cell sets for adjacent cell
-                if dust_weight > 0:
-                    self.dirty_cells.add(position)
-                elif position in self.dirty_cells and dust_weight == 0:
-                    self.dirty_cells.remove(position)
-                    self.cleaned_cells.add(position)
+                # Initialize map entry if needed
+                if adjacent_info is None:
+                    adjacent_info = known_map[position] = {}
+            
+            adjacent_info['dust_weight'] = dust_weight
+            adjacent_info['cleaned'] = dust_weight == 0
+            
+            self._record_dust(position, dust_weight)
     
-    # ---- Pathfinding Methods ----
+    def _record_dust(self, position: Tuple[int, int], dust_weight: float):
+        """Update dirty/clean cell sets from a dust reading."""
+        if dust_weight > 0:
+            self._add_dirty(position)
+        elif position in self.dirty_cells and dust_weight == 0:
+            self._remove_dirty(position)
+            self.cleaned_cells.add(position)
     
-    def manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
-        """Calculate Manhattan distance between two positions."""
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+    def _add_dirty(self, position: Tuple[int, int]):
+        """Record a dirty cell in the dirty set and the diagonal index."""
+        if position in self.dirty_cells:
+            return
+
+        self.dirty_cells.add(position)
+        insort(self._dirty_by_diagonal, (position[0] + position[1], position[0] - position[1]))
+        self._spread_dirt_proximity(position, 1)
+
+    def _remove_dirty(self, position: Tuple[int, int]):
+        """Remove a dirty cell from the dirty set and the diagonal index."""
+        self.dirty_cells.remove(position)
+        key = (position[0] + position[1], position[0] - position[1])
+        del self._dirty_by_diagonal[bisect_left(self._dirty_by_diagonal, key)]
+        self._spread_dirt_proximity(position, -1)
 
+    def _spread_dirt_proximity(self, position: Tuple[int, int], sign: int):
+        """Add (sign=1) or remove (sign=-1) a dirty cell's nearby-dirt bonus."""
+        proximity = self._dirt_proximity
+        for dx, dy, bonus in DIRT_PROXIMITY_STENCIL:
+            neighbor_pos = (position[0] + dx, position[1] + dy)
+            value = proximity.get(neighbor_pos, 0.0) + sign * bonus
+            if value:
+                proximity[neighbor_pos] = value
+            else:
+                del proximity[neighbor_pos]
+
+    # ---- Pathfinding Methods ----
+    
     def find_path_to_dirt(self, env: Environment) -> Optional[List[Direction]]:
         """Find path to closest dirty cell using A* pathfinding."""
         if not self.dirty_cells:
             return None
         
         # Find closest dirty cell
-        closest_dirt = None
-        min_distance = float('inf')
-        
-        for dirt_pos in self.dirty_cells:
-            distance = self.manhattan_distance(self.position, dirt_pos)
-            if distance < min_distance:
-                min_distance = distance
-                closest_dirt = dirt_pos
+        closest_dirt = self.find_closest_dirt()
         
         if closest_dirt:
             path = self.a_star_pathfind(closest_dirt)
@@ -230,71 +281,103 @@ class VacuumAgent:
         
         return None
 
+    def find_closest_dirt(self) -> Optional[Tuple[int, int]]:
+        """
+        Find the known dirty cell closest to the agent by Manhattan distance,
+        breaking ties by the smallest (x, y).
+        In (x+y, x-y) coordinates the distance is the larger coordinate gap,
+        so each sweep stops once the x+y gap alone exceeds the best distance.
+        """
+        cells = self._dirty_by_diagonal
+        u = self.position[0] + self.position[1]
+        v = self.position[0] - self.position[1]
+        start = bisect_left(cells, (u,))
+
+        # Sweep towards smaller x+y, then towards larger x+y, keeping the
+        # smallest (distance, x, y) seen
+        best = None
+        for indices in (range(start - 1, -1, -1), range(start, len(cells))):
+            for k in indices:
+                cell_u, cell_v = cells[k]
+                gap = abs(cell_u - u)
+                if best is not None and gap > best[0]:
+                    break
+
+                candidate = (max(gap, abs(cell_v - v)), (cell_u + cell_v) // 2, (cell_u - cell_v) // 2)
+                if best is None or candidate < best:
+                    best = candidate
+
+        if best is None:
+            return None
+
+        return best[1], best[2]
+
     def a_star_pathfind(self, target_pos: Tuple[int, int]) -> Optional[List[Direction]]:
         """A* pathfinding algorithm to find path to target position."""
+        # Bind loop-invariant lookups to locals for the search loop
+        known_map = self.map
+        max_safe_height = MAX_SAFE_HEIGHT
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        target_x, target_y = target_pos
+        neighbors = self._neighbor_table
+
         # Initialize data structures
+        # Open set entries are (f, h, counter, position): equal f favours the
+        # node nearer the target, then insertion order, never tuple compares.
+        # A node is pushed again when its score improves; stale entries are
+        # skipped when popped.
         open_set = []
-        in_open_set = {}
+        counter = itertools.count()
         closed_set = set()
         
         g_score = {self.position: 0}
-        f_score = {self.position: self.manhattan_distance(self.position, target_pos)}
         came_from = {}
         
         # Start from current position
-        heapq.heappush(open_set, (f_score[self.position], self.position))
-        in_open_set[self.position] = True
+        start_h = abs(self.position[0] - target_x) + abs(self.position[1] - target_y)
+        heappush(open_set, (start_h, start_h, next(counter), self.position))
         
         while open_set:
-            _, current_pos = heapq.heappop(open_set)
-            in_open_set.pop(current_pos, None)
+            current_pos = heappop(open_set)[3]
+            
+            # Skip stale entries for nodes already expanded
+            if current_pos in closed_set:
+                continue
             
             # Check if reached target
             if current_pos == target_pos:
                 return self.reconstruct_path(came_from, current_pos)
             
             closed_set.add(current_pos)
+            current_x, current_y = current_pos
+            current_cell = known_map[current_pos]
+            tentative_g_score = g_score[current_pos] + 1
             
             # Check all possible directions
-            for next_dir in self.directions:
-                next_pos = (
-                    current_pos[0] + next_dir.movement_vector[0],
-                    current_pos[1] + next_dir.movement_vector[1]
-                )
+            for dx, dy, delta_key, next_dir in neighbors:
+                next_pos = (current_x + dx, current_y + dy)
                 
-                # Skip if already evaluated
-                if next_pos in closed_set:
-                    continue
-                    
-                # Skip if not in map
-                if next_pos not in self.map:
+                # Skip if already evaluated or not in map
+                if next_pos in closed_set or next_pos not in known_map:
                     continue
                 
-                # Skip if height delta unknown
-                if next_dir.delta_key not in self.map[current_pos]:
-                    continue
-                    
-                # Skip if height difference too large
-                height_diff = self.map[current_pos][next_dir.delta_key]
-                if abs(height_diff) > self.settings.MAX_SAFE_HEIGHT:
+                # Skip if height delta unknown or too large
+                height_diff = current_cell.get(delta_key)
+                if height_diff is None or abs(height_diff) > max_safe_height:
                     continue
                 
-                # Calculate new score
-                tentative_g_score = g_score[current_pos] + 1
-                
                 # Skip if already have better path
-                if next_pos in g_score and tentative_g_score >= g_score[next_pos]:
+                if tentative_g_score >= g_score.get(next_pos, tentative_g_score + 1):
                     continue
                     
                 # Record this path
                 came_from[next_pos] = (current_pos, next_dir)
                 g_score[next_pos] = tentative_g_score
-                f_score[next_pos] = tentative_g_score + self.manhattan_distance(next_pos, target_pos)
                 
-                # Add to open set if not already there
-                if next_pos not in in_open_set:
-                    heapq.heappush(open_set, (f_score[next_pos], next_pos))
-                    in_open_set[next_pos] = True        
+                # Add to open set with the improved score
+                h_score = abs(next_pos[0] - target_x) + abs(next_pos[1] - target_y)
+                heappush(open_set, (tentative_g_score + h_score, h_score, next(counter), next_pos))
         return None
 
     def reconstruct_path(self, came_from: Dict, current_pos: Tuple[int, int]) -> List[Direction]:
@@ -322,6 +405,20 @@ class VacuumAgent:
         # Otherwise move forward
         return self.move_forward(env)
     
+    def _execute_current_path_step(self, env: Environment):
+        """Take the next step of the current path, dropping the path if blocked."""
+        next_direction = self.current_path[0]
+        
+        if next_direction != self.direction:
+            self.rotate(next_direction)
+            return
+        
+        moved = self.move_forward(env)
+        if moved:
+            self.current_path.popleft()
+        else:
+            self.current_path = None
+    
     # ---- Decision-Making Methods ----
     
     def calculate_curiosity_factor(self) -> float:
@@ -348,45 +445,39 @@ class VacuumAgent:
         
         # Count unknown neighbors
         unknown_neighbors = 0
-        for direction in self.directions:
-            neighbor_pos = (
-                position[0] + direction.movement_vector[0],
-                position[1] + direction.movement_vector[1]
-            )
-            if neighbor_pos not in self.map:
+        for dx, dy, _, _ in self._neighbor_table:
+            if (position[0] + dx, position[1] + dy) not in self.map:
                 unknown_neighbors += 1
         
         # Return normalized value
         return unknown_neighbors / 4.0
 
-    def calculate_move_utility(self, env: Environment, direction: Direction) -> float:
+    def calculate_move_utility(self, env: Environment, direction: Direction, curiosity_factor: float) -> float:
         """Calculate utility value of moving in specified direction."""
         utility = 0.0
         
         # Calculate target position
-        target_x = self.position[0] + direction.movement_vector[0]
-        target_y = self.position[1] + direction.movement_vector[1]
+        move_vector = MOVE_VECS[direction]
+        target_x = self.position[0] + move_vector[0]
+        target_y = self.position[1] + move_vector[1]
         target_pos = (target_x, target_y)
         
         # Check if target cell exists
-        target_cell = env.get_cell(*target_pos)
-        if not target_cell:
+        target_cell = env.index(target_x, target_y)
+        if target_cell is None:
             return -100.0  # Large penalty for invalid moves
         
         # Calculate rotation cost
         rotation_cost = 0.0
         if direction != self.direction:
-            diff = (direction.angle - self.direction.angle) % 360
-            if diff > 180:
-                diff -= 360
-            rotations = abs(diff) / 90
+            rotations = ROT_COUNT[self.direction][direction]
             rotation_cost = rotations * self.settings.rotation_power
         
         # Check height safety
-        current_cell = env.get_cell(*self.position)
-        if current_cell and direction.delta_key in current_cell:
-            height_diff = current_cell[direction.delta_key]
-            if abs(height_diff) > self.settings.MAX_SAFE_HEIGHT:
+        cell = env.index(*self.position)
+        if cell is not None:
+            height_diff = env.deltas[direction][cell[0]][cell[1]]
+            if abs(height_diff) > MAX_SAFE_HEIGHT:
                 return -100.0  # Large penalty for unsafe moves
         
         # Utility factors
@@ -400,21 +491,13 @@ class VacuumAgent:
             utility += 30.0
         
         # Bonus for cells near dirt
-        nearby_dirt_bonus = 0.0
-        for dirty_pos in self.dirty_cells:
-            distance = self.manhattan_distance(target_pos, dirty_pos)
-            if distance <= 2:
-                nearby_dirt_bonus += (3.0 - distance) * 3.0
-        utility += nearby_dirt_bonus
+        utility += self._dirt_proximity.get(target_pos, 0.0)
         
         # Power consumption penalty
         power_cost = self.settings.move_power + rotation_cost
         power_penalty = power_cost * 5
         utility -= power_penalty
 
-        # Exploration vs exploitation balance
-        curiosity_factor = self.calculate_curiosity_factor()
-            
         # Recency value (prefer cells not visited recently)
         recency_value = 0.0
         if target_pos in self.last_visit_time:
@@ -431,7 +514,7 @@ class VacuumAgent:
         frontier_value = self.calculate_frontier_value(target_pos) * 35.0
         
         # Penalty for clean cells with no exploration value
-        if frontier_value == 0 and target_cell['cleaned'] == True:
+        if frontier_value == 0 and env.cleaned[target_cell[0]][target_cell[1]]:
             utility -= 100
 
         # Frequency value (prefer cells visited fewer times)
@@ -449,13 +532,13 @@ class VacuumAgent:
 
         return utility
 
-    def decide_next_move(self, env: Environment) -> Tuple[Direction, float]:
+    def decide_next_move(self, env: Environment, curiosity_factor: float) -> Tuple[Direction, float]:
         """Decide best direction to move based on utility calculations."""
         utilities = {}
         
         # Calculate utility for each direction
         for direction in self.directions:
-            utilities[direction] = self.calculate_move_utility(env, direction)
+            utilities[direction] = self.calculate_move_utility(env, direction, curiosity_factor)
         
         # Find direction with highest utility
         best_direction = max(utilities, key=utilities.get)
@@ -473,29 +556,18 @@ class VacuumAgent:
         
         if (current_dust and current_dust[1] > 0) and (self.position not in self.cleaned_cells):
             # Try normal suction first
-            self.suck_dust(env, "normal")
-            current_dust = self.sense_dust(env, 'current')
+            remaining_dust = self.suck_dust(env, SuctionMode.NORMAL)
 
             # If still dirty, use heavy suction
-            if current_dust and current_dust[1] > 0:
-                self.suck_dust(env, "heavy")
+            if remaining_dust:
+                self.suck_dust(env, SuctionMode.HEAVY)
 
             # Mark as cleaned
             self.cleaned_cells.add(self.position)
         
         # If following a path, continue
         if self.current_path:
-            next_direction = self.current_path[0]
-            
-            if next_direction != self.direction:
-                self.rotate(next_direction)
-                return
-            
-            moved = self.move_forward(env)
-            if moved:
-                self.current_path.pop(0)
-            else:
-                self.current_path = None
+            self._execute_current_path_step(env)
             return
         
         # Determine whether to clean or explore
@@ -505,12 +577,12 @@ class VacuumAgent:
         if self.dirty_cells and curiosity_factor < 0.7:
             path = self.find_path_to_dirt(env)
             if path:
-                self.current_path = path
-                self.decide_action(env)
+                self.current_path = deque(path)
+                self._execute_current_path_step(env)
                 return
 
         # Otherwise, choose best move based on utility
-        best_direction, best_utility = self.decide_next_move(env)    
+        best_direction, best_utility = self.decide_next_move(env, curiosity_factor)    
         
         # Only move if utility high enough
         if best_utility < 50.0:
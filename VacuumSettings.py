@@ -1,35 +1,122 @@
+import glob
+import mmap
+import os
+import re
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum
+
+# Constants
+MAX_SAFE_HEIGHT = 3  # Maximum safe height difference for movement
+MAX_SUCTION_NORMAL = 1  # Dust removal with normal suction
+MAX_SUCTION_HEAVY = 5  # Dust removal with heavy suction
+
+# Whitespace-separated tokens in the settings file
+_TOKEN = re.compile(rb'\S+')
+
+class SuctionMode(IntEnum):
+    """Suction pressure levels, usable as indices into per-mode tuples."""
+    NORMAL = 0
+    HEAVY = 1
+
+# Dust removal per suction type, indexed by SuctionMode
+MAX_SUCTION_WEIGHT = (MAX_SUCTION_NORMAL, MAX_SUCTION_HEAVY)
+
+@dataclass(slots=True, frozen=True)
 class VacuumSettings:
     """Stores operational parameters for the vacuum agent."""
-    
-    def __init__(self, settings_file: str, verbose: bool = False):
-        """Load settings from file and set up operational constants."""
-        with open(settings_file, 'r') as f:
-            settings = [float(line.strip()) for line in f.readlines()]
-        
-        self.verbose = verbose
-        
-        # Constants
-        self.MAX_SAFE_HEIGHT = 3  # Maximum safe height difference for movement
-        self.MAX_SUCTION_WEIGHT = {'normal': 1, 'heavy': 5}  # Dust removal per suction type
-
-        # Settings from file
-        self.time_duration = settings[0]  
-        self.rotation_power = settings[1] 
-        self.move_power = settings[2]  
-        self.normal_vacuum_power = settings[3]  
-        self.heavy_vacuum_power = settings[4] 
-        self.time_power = settings[5]  
-        self.sensor_power = settings[6]
-        self.other_power = settings[7] 
+    time_duration: float
+    rotation_power: float
+    move_power: float
+    normal_vacuum_power: float
+    heavy_vacuum_power: float
+    time_power: float
+    sensor_power: float
+    other_power: float
+    verbose: bool = False
+
+    @classmethod
+    def from_file(cls, settings_file: str, verbose: bool = False) -> 'VacuumSettings':
+        """Load settings from file."""
+        settings = cls._load_params(settings_file)
+
+        # The file must hold exactly one value per setting, in this order
+        try:
+            (time_duration, rotation_power, move_power, normal_vacuum_power,
+             heavy_vacuum_power, time_power, sensor_power, other_power) = settings
+        except ValueError:
+            raise ValueError(f"Expected 8 settings in {settings_file}, found {len(settings)}") from None
+
+        vacuum_settings = cls(
+            time_duration=time_duration,
+            rotation_power=rotation_power,
+            move_power=move_power,
+            normal_vacuum_power=normal_vacuum_power,
+            heavy_vacuum_power=heavy_vacuum_power,
+            time_power=time_power,
+            sensor_power=sensor_power,
+            other_power=other_power,
+            verbose=verbose
+        )
 
         if verbose:
-            self._print_settings()
-    
+            vacuum_settings._print_settings()
+
+        return vacuum_settings
+
+    @staticmethod
+    def _load_params(settings_file: str) -> array:
+        """
+        Load setting values, reusing a binary cache of a previous parse.
+        The cache lives in __pycache__ beside the settings file and is keyed
+        by the file's modification time and size, so edits invalidate it.
+        """
+        stat = os.stat(settings_file)
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(settings_file)), '__pycache__')
+        cache_prefix = os.path.join(cache_dir, os.path.basename(settings_file))
+        cache_file = f"{cache_prefix}.{stat.st_mtime_ns}-{stat.st_size}.bin"
+
+        params = array('d')
+        try:
+            with open(cache_file, 'rb') as f:
+                params.frombytes(f.read())
+            return params
+        except (OSError, ValueError):
+            del params[:]
+
+        # Tokenise straight from a memory map of the file, so only the tokens
+        # themselves are copied out of the page cache
+        if stat.st_size:
+            with open(settings_file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    params.extend(map(float, _TOKEN.findall(mm)))
+
+        # Replace any cache left over from an older version of the file
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for stale_file in glob.glob(f"{glob.escape(cache_prefix)}.[0-9]*-[0-9]*.bin"):
+                os.remove(stale_file)
+            temp_file = f"{cache_file}.{os.getpid()}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    params.tofile(f)
+                os.replace(temp_file, cache_file)
+            except OSError:
+                # Don't leave a partial write behind in __pycache__
+                os.remove(temp_file)
+                raise
+        except OSError:
+            pass  # Caching is best-effort, e.g. for read-only directories
+
+        return params
+
     def _print_settings(self):
         """Print the loaded settings."""
-        print("Vacuum settings loaded:")
-        print(f"Time duration: {self.time_duration}")
-        print(f"Rotation power: {self.rotation_power}")
-        print(f"Move power: {self.move_power}")
-        print(f"Normal vacuum power: {self.normal_vacuum_power}")
-        print(f"Heavy vacuum power: {self.heavy_vacuum_power}")
+        print(
+            "Vacuum settings loaded:\n"
+            f"Time duration: {self.time_duration}\n"
+            f"Rotation power: {self.rotation_power}\n"
+            f"Move power: {self.move_power}\n"
+            f"Normal vacuum power: {self.normal_vacuum_power}\n"
+            f"Heavy vacuum power: {self.heavy_vacuum_power}"
+        )